@@ -306,7 +306,7 @@ class HotkeyManager:
                         if self.main_window and hasattr(self.main_window, 'write_event_value'):
                             try:
                                 self.main_window.write_event_value('-HOTKEY_ERROR-', f"热键事件发送失败: {e}")
-                            except:
+                            except Exception:
                                 pass  # 避免递归错误
                         # 备用方案：使用原有回调（但不安全）
                         if self.on_switcher_triggered:
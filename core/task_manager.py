@@ -139,6 +139,19 @@ class Task:
         
         return cls(**data)
 
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> List['Task']:
+        """批量从字典创建任务，跳过无法解析的条目"""
+        from_dict = cls.from_dict
+        tasks: List['Task'] = []
+        for row in rows:
+            try:
+                tasks.append(from_dict(row))
+            except Exception as e:
+                name = row.get('name', 'Unknown') if isinstance(row, dict) else 'Unknown'
+                print(f"加载任务失败 {name}: {e}")
+        return tasks
+
     @staticmethod
     def _normalize_todo_items(raw_items: Any) -> List[Dict[str, Any]]:
         """标准化 todo_items，兼容历史数据格式。"""
@@ -4,7 +4,6 @@ PySide6 主窗口模块
 ContextSwitcher 的 PySide6 主窗口实现
 """
 
-import time
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING, List
 
@@ -55,6 +54,26 @@ class QtMainWindow(FramelessWindow):
         "待审查": "review",
     }
 
+    # 工具栏按钮定义：(文本, 样式, 提示, 回调方法名)
+    TOOLBAR_BUTTONS = (
+        ("＋", "success", "添加新任务并绑定窗口", "_on_add_task"),
+        ("✎", "primary", "编辑选中的任务", "_on_edit_task"),
+        ("✕", "error", "删除选中的任务", "_on_delete_task"),
+        ("🍅", "error", "番茄钟专注模式", "_on_pomodoro_toggle"),
+        ("📊", "primary", "查看专注统计", "_on_stats"),
+        ("⚙", "warning", "打开设置", "_on_settings"),
+    )
+
+    # 今日时间/目标显示（单个富文本标签，仅时间部分随刷新变化）
+    TODAY_TIME_TEMPLATE = (
+        '今日: <span style="color: #0078D4;">{time}</span>'
+        ' / <span style="color: #CCCCCC;">2h</span>'
+    )
+
+    # 状态指示器样式（就绪/专注中）
+    INDICATOR_READY_STYLE = "color: #107C10; font-size: 12pt;"
+    INDICATOR_FOCUS_STYLE = "color: #D13438; font-size: 12pt;"
+
     def __init__(
         self,
         task_manager: 'TaskManager',
@@ -74,7 +93,6 @@ class QtMainWindow(FramelessWindow):
         # 状态
         self.running = True
         self.refresh_interval = 2.0  # 秒
-        self.last_refresh = 0
 
         # 筛选状态
         self.current_search = ""
@@ -101,10 +119,10 @@ class QtMainWindow(FramelessWindow):
         self._setup_ui()
         self._ensure_window_size()
 
-        # 设置定时刷新
-        self._refresh_timer = QTimer()
+        # 设置定时刷新（仅在窗口可见时运行，见 showEvent/hideEvent）
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(int(self.refresh_interval * 1000))
         self._refresh_timer.timeout.connect(self._on_refresh_timer)
-        self._refresh_timer.start(int(self.refresh_interval * 1000))
 
         # 初始加载任务
         self._refresh_tasks()
@@ -173,7 +191,7 @@ class QtMainWindow(FramelessWindow):
 
         # 指示器
         self.indicator_label = QLabel("●")
-        self.indicator_label.setStyleSheet("color: #107C10; font-size: 12pt;")
+        self.indicator_label.setStyleSheet(self.INDICATOR_READY_STYLE)
         self.indicator_label.setToolTip("就绪")
         layout.addWidget(self.indicator_label)
 
@@ -274,22 +292,13 @@ class QtMainWindow(FramelessWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(1)
 
-        buttons = [
-            ("＋", "success", "添加新任务并绑定窗口", self._on_add_task),
-            ("✎", "primary", "编辑选中的任务", self._on_edit_task),
-            ("✕", "error", "删除选中的任务", self._on_delete_task),
-            ("🍅", "error", "番茄钟专注模式", self._on_pomodoro_toggle),
-            ("📊", "primary", "查看专注统计", self._on_stats),
-            ("⚙", "warning", "打开设置", self._on_settings),
-        ]
-
-        for text, style, tooltip, callback in buttons:
+        for text, style, tooltip, handler_name in self.TOOLBAR_BUTTONS:
             btn = QPushButton(text)
             btn.setProperty("data-style", style)
             btn.setProperty("data-size", "square")
             btn.setToolTip(tooltip)
             btn.setFixedSize(24, 24)
-            btn.clicked.connect(callback)
+            btn.clicked.connect(getattr(self, handler_name))
             layout.addWidget(btn)
 
         return layout
@@ -300,18 +309,11 @@ class QtMainWindow(FramelessWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(3)
 
-        # 今日时间
-        layout.addWidget(QLabel("今日:"))
-        self.today_time_label = QLabel("0m")
-        self.today_time_label.setStyleSheet("color: #0078D4;")
+        # 今日时间 / 目标
+        self.today_time_label = QLabel(self.TODAY_TIME_TEMPLATE.format(time="0m"))
+        self.today_time_label.setTextFormat(Qt.RichText)
         layout.addWidget(self.today_time_label)
 
-        layout.addWidget(QLabel("/"))
-
-        goal_label = QLabel("2h")
-        goal_label.setStyleSheet("color: #CCCCCC;")
-        layout.addWidget(goal_label)
-
         # 番茄钟
         self.focus_icon_label = QLabel("🍅")
         self.focus_icon_label.setVisible(False)
@@ -443,11 +445,8 @@ class QtMainWindow(FramelessWindow):
 
     def _on_refresh_timer(self):
         """定时刷新"""
-        current_time = time.time()
-        if current_time - self.last_refresh >= self.refresh_interval:
-            self._refresh_tasks()
-            self._update_today_time()
-            self.last_refresh = current_time
+        self._refresh_tasks()
+        self._update_today_time()
 
     def _on_search_changed(self, text: str):
         """搜索框文本变化"""
@@ -834,10 +833,8 @@ class QtMainWindow(FramelessWindow):
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
 
-        if hours > 0:
-            self.today_time_label.setText(f"{hours}h {minutes}m")
-        else:
-            self.today_time_label.setText(f"{minutes}m")
+        time_text = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+        self.today_time_label.setText(self.TODAY_TIME_TEMPLATE.format(time=time_text))
 
     # ========== 番茄钟功能 ==========
 
@@ -859,7 +856,7 @@ class QtMainWindow(FramelessWindow):
         self.pomodoro_timer.start(1000)  # 每秒更新
 
         self.set_status("番茄钟已启动 - 专注25分钟")
-        self.indicator_label.setStyleSheet("color: #D13438; font-size: 12pt;")
+        self.indicator_label.setStyleSheet(self.INDICATOR_FOCUS_STYLE)
 
     def _pomodoro_stop(self):
         """停止番茄钟"""
@@ -874,7 +871,7 @@ class QtMainWindow(FramelessWindow):
         self.focus_timer_label.setText("--:--")
 
         self.set_status("番茄钟已停止")
-        self.indicator_label.setStyleSheet("color: #107C10; font-size: 12pt;")
+        self.indicator_label.setStyleSheet(self.INDICATOR_READY_STYLE)
 
     def _pomodoro_tick(self):
         """番茄钟计时"""
@@ -919,6 +916,9 @@ class QtMainWindow(FramelessWindow):
 
     def update_display(self):
         """更新显示（供外部调用）"""
+        # 隐藏到托盘时跳过刷新：hideEvent 会停止定时刷新，showEvent 再显示时立即补刷一次
+        if not self.isVisible():
+            return
         self._refresh_tasks()
         self._update_today_time()
 
@@ -976,7 +976,15 @@ class QtMainWindow(FramelessWindow):
         if hasattr(self, "todo_popup") and self.todo_popup.isVisible():
             self._position_todo_popup()
 
+    def showEvent(self, event):
+        """窗口显示时立即刷新并恢复定时刷新。"""
+        super().showEvent(event)
+        if not self._refresh_timer.isActive():
+            self._on_refresh_timer()
+            self._refresh_timer.start()
+
     def hideEvent(self, event):
-        """主窗口隐藏时同步隐藏浮层。"""
+        """主窗口隐藏时同步隐藏浮层，并暂停定时刷新。"""
         self._hide_todo_popup()
+        self._refresh_timer.stop()
         super().hideEvent(event)
@@ -6,7 +6,7 @@ PySide6 任务编辑对话框
 
 from typing import List, Optional, Dict
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QComboBox, QListWidget, QPushButton, QDialogButtonBox,
@@ -25,7 +25,13 @@ from gui.qt.styles import get_dark_theme
 class QtTaskDialog(QDialog):
     """任务编辑对话框"""
 
-    WINDOW_COLUMNS = ["选择", "窗口标题", "进程", "句柄"]
+    WINDOW_COLUMNS = ("选择", "窗口标题", "进程", "句柄")
+
+    # 选择列的勾选标记
+    SELECTED_MARK = "✓"
+
+    # 窗口搜索防抖间隔（毫秒）
+    SEARCH_DEBOUNCE_MS = 150
 
     STATUS_OPTIONS = [
         ("待办", TaskStatus.TODO),
@@ -54,7 +60,14 @@ class QtTaskDialog(QDialog):
         self._selected_hwnds: set[int] = set()
         self._all_windows: List[WindowInfo] = []
         self._filtered_windows: List[WindowInfo] = []
+        self._row_by_hwnd: Dict[int, int] = {}
         self._search_results: Dict[int, object] = {}
+        self._query_results: Dict[str, list] = {}
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter_and_sort)
 
         self._setup_ui()
         self.setStyleSheet(get_dark_theme())
@@ -125,7 +138,7 @@ class QtTaskDialog(QDialog):
         windows_layout.addLayout(search_row)
 
         self.window_table = QTableWidget(0, len(self.WINDOW_COLUMNS))
-        self.window_table.setHorizontalHeaderLabels(self.WINDOW_COLUMNS)
+        self.window_table.setHorizontalHeaderLabels(list(self.WINDOW_COLUMNS))
         self.window_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.window_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.window_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -252,12 +265,17 @@ class QtTaskDialog(QDialog):
         row = self.window_table.currentRow()
         if row < 0 or row >= len(self._filtered_windows):
             return
-        window = self._filtered_windows[row]
+        self._add_window(self._filtered_windows[row])
+
+    def _add_window(self, window: WindowInfo):
+        """添加单个窗口，只追加列表项并更新对应行的勾选标记"""
         if window.hwnd in self._selected_hwnds:
             return
         self._selected_windows.append(window)
         self._selected_hwnds.add(window.hwnd)
-        self._refresh_windows_list()
+        self.windows_list.addItem(f"{window.title} ({window.process_name})")
+        self._update_selection_mark(window.hwnd)
+        self._update_filter_count()
 
     def _remove_selected_window(self):
         current_row = self.windows_list.currentRow()
@@ -268,12 +286,13 @@ class QtTaskDialog(QDialog):
         self._remove_selected_window_at(row)
 
     def _remove_selected_window_at(self, row: int):
-        if row < 0:
+        if row < 0 or row >= len(self._selected_windows):
             return
-        if 0 <= row < len(self._selected_windows):
-            removed = self._selected_windows.pop(row)
-            self._selected_hwnds.discard(removed.hwnd)
-        self._refresh_windows_list()
+        removed = self._selected_windows.pop(row)
+        self._selected_hwnds.discard(removed.hwnd)
+        self.windows_list.takeItem(row)
+        self._update_selection_mark(removed.hwnd)
+        self._update_filter_count()
 
     def _on_save(self):
         name = self.name_input.text().strip()
@@ -330,16 +349,20 @@ class QtTaskDialog(QDialog):
         self.accept()
 
     def _on_search_changed(self, _text: str):
-        self._apply_filter_and_sort()
+        self._search_timer.start()
 
     def _clear_search(self):
         self.window_search.setText("")
+        self._search_timer.stop()
         self._apply_filter_and_sort()
 
     def _refresh_window_list(self):
         try:
             self.window_manager.invalidate_cache()
             self._all_windows = self.window_manager.enumerate_windows()
+            self._query_results.clear()
+            # 立即按当前搜索词筛选，丢弃此前（如 _reset_fields 清空搜索框时）排队的防抖筛选
+            self._search_timer.stop()
             self._apply_filter_and_sort()
         except Exception as e:
             print(f"刷新窗口列表失败: {e}")
@@ -347,12 +370,17 @@ class QtTaskDialog(QDialog):
     def _apply_filter_and_sort(self):
         query = self.window_search.text().strip()
         if query:
-            search_results = self.search_helper.search_windows(self._all_windows, query)
+            # 同一份窗口列表内按查询词缓存结果（回删、重复输入时直接复用）
+            search_results = self._query_results.get(query)
+            if search_results is None:
+                search_results = self.search_helper.search_windows(self._all_windows, query)
+                self._query_results[query] = search_results
             self._search_results = {result.item.hwnd: result for result in search_results}
             filtered = [result.item for result in search_results]
         else:
+            # 无搜索词时直接交给优先级排序（其返回新列表，不会修改原列表），无需复制
             self._search_results = {}
-            filtered = list(self._all_windows)
+            filtered = self._all_windows
 
         try:
             active_info = self.window_manager.get_active_windows_info()
@@ -366,14 +394,19 @@ class QtTaskDialog(QDialog):
         self._populate_table()
 
     def _populate_table(self):
-        self.window_table.setRowCount(len(self._filtered_windows))
-        for row, window in enumerate(self._filtered_windows):
-            self._set_table_row(row, window)
-        self._update_table_selection_marks()
+        # 行数据一次性写入后再统一重绘；勾选标记已在 _set_table_row 中设置
+        self.window_table.setUpdatesEnabled(False)
+        try:
+            self.window_table.setRowCount(len(self._filtered_windows))
+            self._row_by_hwnd = {window.hwnd: row for row, window in enumerate(self._filtered_windows)}
+            for row, window in enumerate(self._filtered_windows):
+                self._set_table_row(row, window)
+        finally:
+            self.window_table.setUpdatesEnabled(True)
         self._update_filter_count()
 
     def _set_table_row(self, row: int, window: WindowInfo):
-        selected_item = QTableWidgetItem("✓" if window.hwnd in self._selected_hwnds else "")
+        selected_item = QTableWidgetItem(self.SELECTED_MARK if window.hwnd in self._selected_hwnds else "")
         selected_item.setTextAlignment(Qt.AlignCenter)
         selected_item.setData(Qt.UserRole, window.hwnd)
         self.window_table.setItem(row, 0, selected_item)
@@ -389,10 +422,21 @@ class QtTaskDialog(QDialog):
         self.window_table.setItem(row, 3, hwnd_item)
 
     def _update_table_selection_marks(self):
+        selected_hwnds = self._selected_hwnds
+        table_item = self.window_table.item
+        mark = self.SELECTED_MARK
         for row, window in enumerate(self._filtered_windows):
-            item = self.window_table.item(row, 0)
+            item = table_item(row, 0)
             if item:
-                item.setText("✓" if window.hwnd in self._selected_hwnds else "")
+                item.setText(mark if window.hwnd in selected_hwnds else "")
+
+    def _update_selection_mark(self, hwnd: int):
+        row = self._row_by_hwnd.get(hwnd)
+        if row is None:
+            return
+        item = self.window_table.item(row, 0)
+        if item:
+            item.setText(self.SELECTED_MARK if hwnd in self._selected_hwnds else "")
 
     def _update_filter_count(self):
         total = len(self._filtered_windows)
@@ -405,12 +449,7 @@ class QtTaskDialog(QDialog):
     def _on_window_double_clicked(self, item: QTableWidgetItem):
         row = item.row()
         if 0 <= row < len(self._filtered_windows):
-            window = self._filtered_windows[row]
-            if window.hwnd in self._selected_hwnds:
-                return
-            self._selected_windows.append(window)
-            self._selected_hwnds.add(window.hwnd)
-            self._refresh_windows_list()
+            self._add_window(self._filtered_windows[row])
 
 
 __all__ = ["QtTaskDialog"]
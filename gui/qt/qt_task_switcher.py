@@ -31,6 +31,9 @@ class QtTaskSwitcher(QDialog):
         "paused": "已暂停",
     }
 
+    # 对话框位置缓存有效期（秒），与 ScreenHelper 的屏幕信息缓存保持一致
+    POSITION_CACHE_TTL = 5.0
+
     def __init__(self, task_manager: TaskManager):
         super().__init__(None)
         self.task_manager = task_manager
@@ -44,14 +47,22 @@ class QtTaskSwitcher(QDialog):
         self.selected_index = 0
         self._switch_success = False
         self._auto_executed = False
-        self._start_time = 0.0
+        self._position_cache: Optional[Tuple[tuple, Tuple[int, int], float]] = None
 
+        # 倒计时显示定时器（仅刷新标签）
         self._timer = QTimer(self)
         self._timer.setInterval(100)
         self._timer.timeout.connect(self._on_timer_tick)
 
+        # 自动切换定时器（单次触发，到期即执行切换）
+        self._auto_switch_timer = QTimer(self)
+        self._auto_switch_timer.setSingleShot(True)
+        self._auto_switch_timer.timeout.connect(self._on_auto_switch_timeout)
+
+        # 样式表延迟到首次显示时应用（热键可能整个会话都不会触发）
+        self._theme_applied = False
+
         self._setup_ui()
-        self.setStyleSheet(get_dark_theme())
 
         self._load_config()
     def _setup_ui(self):
@@ -92,6 +103,8 @@ class QtTaskSwitcher(QDialog):
             print("任务切换器功能已禁用")
             return False
 
+        self._ensure_theme()
+
         self.tasks = self.task_manager.get_all_tasks()
         if not self.tasks:
             self._show_no_tasks_message()
@@ -102,41 +115,75 @@ class QtTaskSwitcher(QDialog):
 
         self._switch_success = False
         self._auto_executed = False
-        self._start_time = time.time()
+        self._reset_timer()
         self._timer.start()
 
         try:
             result = self.exec()
         finally:
             self._timer.stop()
+            self._auto_switch_timer.stop()
 
         if result == QDialog.Accepted:
             return self._switch_success
         return False
 
+    def _ensure_theme(self):
+        if self._theme_applied:
+            return
+        self.setStyleSheet(get_dark_theme())
+        self._theme_applied = True
+
     def _apply_dialog_position(self, main_window_position: Optional[Tuple[int, int]]):
         window_size = self._window_size
         self.resize(*window_size)
 
-        position = get_dialog_position_manager().get_switcher_dialog_position(
-            window_size, main_window_position
-        )
+        position = self._get_cached_position(window_size, main_window_position)
+        if position is None:
+            position = get_dialog_position_manager().get_switcher_dialog_position(
+                window_size, main_window_position
+            )
+            # 未提供主窗口位置时结果依赖鼠标位置，不做缓存
+            if main_window_position is not None:
+                self._position_cache = (
+                    (window_size, tuple(main_window_position)), position, time.monotonic()
+                )
         self.move(position[0], position[1])
 
-    def _build_task_list(self):
-        self.list_widget.clear()
+    def _get_cached_position(
+        self, window_size: Tuple[int, int], main_window_position: Optional[Tuple[int, int]]
+    ) -> Optional[Tuple[int, int]]:
+        if main_window_position is None or self._position_cache is None:
+            return None
 
-        for idx, task in enumerate(self.tasks):
-            status_value = task.status.value if isinstance(task.status, TaskStatus) else task.status
-            status_text = self.STATUS_TEXT.get(status_value, status_value)
-            window_count = len(task.bound_windows)
-            item_text = f"{idx + 1}. {task.name}   [{status_text}]   窗口: {window_count}"
-            item = QListWidgetItem(item_text)
-            self.list_widget.addItem(item)
+        key, position, cached_at = self._position_cache
+        if key != (window_size, tuple(main_window_position)):
+            return None
+        if time.monotonic() - cached_at >= self.POSITION_CACHE_TTL:
+            return None
+        return position
 
-        self.selected_index = 0
-        if self.list_widget.count() > 0:
-            self.list_widget.setCurrentRow(0)
+    def _build_task_list(self):
+        # 循环外取出查找表，避免每行重复属性查找
+        status_lookup = self.STATUS_TEXT.get
+        item_texts = []
+        for idx, task in enumerate(self.tasks, 1):
+            status = task.status
+            status_value = status.value if isinstance(status, TaskStatus) else status
+            status_text = status_lookup(status_value, status_value)
+            item_texts.append(f"{idx}. {task.name}   [{status_text}]   窗口: {len(task.bound_windows)}")
+
+        # 批量更新：暂停重绘，整体替换后只刷新一次
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.clear()
+            self.list_widget.addItems(item_texts)
+
+            self.selected_index = 0
+            if self.list_widget.count() > 0:
+                self.list_widget.setCurrentRow(0)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
     def _on_selection_changed(self):
         row = self.list_widget.currentRow()
@@ -148,19 +195,21 @@ class QtTaskSwitcher(QDialog):
         self._execute_selected_task()
 
     def _reset_timer(self):
-        self._start_time = time.time()
+        self._auto_switch_timer.start(int(self._auto_close_delay * 1000))
 
     def _on_timer_tick(self):
         if self._auto_executed:
             return
 
-        elapsed = time.time() - self._start_time
-        remaining = max(0.0, self._auto_close_delay - elapsed)
+        remaining = max(0, self._auto_switch_timer.remainingTime()) / 1000.0
         self.countdown_label.setText(f"自动切换: {remaining:.1f}s")
 
-        if remaining <= 0:
-            self._auto_executed = True
-            self._execute_selected_task(auto=True)
+    def _on_auto_switch_timeout(self):
+        if self._auto_executed:
+            return
+
+        self._auto_executed = True
+        self._execute_selected_task(auto=True)
 
     def _execute_selected_task(self, auto: bool = False):
         if not (0 <= self.selected_index < len(self.tasks)):
@@ -214,7 +263,8 @@ class QtTaskSwitcher(QDialog):
         if Qt.Key_1 <= key <= Qt.Key_9:
             index = key - Qt.Key_1
             if index < len(self.tasks):
-                self.list_widget.setCurrentRow(index)
+                # 对话框即将关闭，直接记录索引，不再驱动列表选中与重绘
+                self.selected_index = index
                 self._execute_selected_task()
             return
 
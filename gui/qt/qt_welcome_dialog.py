@@ -17,17 +17,52 @@ from gui.qt.styles import get_dark_theme
 class QtWelcomeDialog(QDialog):
     """欢迎/首次运行引导对话框"""
 
+    # 页面内容定义：(对齐方式, 末尾是否追加弹性空间, ((标签类型, 参数...), ...))
+    PAGES = (
+        (Qt.AlignCenter, False, (
+            ("center", "欢迎使用", 12, "#888888"),
+            ("center", "ContextSwitcher", 20, "#0078D4", True),
+            ("center", ""),
+            ("center", "一款专为开发者设计的多任务上下文切换工具", 10, "#CCCCCC"),
+            ("center", "快速切换不同任务的窗口环境", 9, "#888888"),
+            ("center", "让您专注于当前工作，提升效率", 9, "#888888"),
+        )),
+        (Qt.AlignLeft, True, (
+            ("title", "核心功能"),
+            ("feature", "任务管理", "创建任务并绑定窗口"),
+            ("feature", "快捷切换", "Ctrl+Alt+Space 快速切换"),
+            ("feature", "窗口记忆", "自动记忆文件夹路径"),
+            ("feature", "时间追踪", "记录任务专注时间"),
+        )),
+        (Qt.AlignLeft, True, (
+            ("title", "快速开始"),
+            ("step", "1.", "点击 [+] 添加新任务"),
+            ("step", "2.", "为任务选择要绑定的窗口"),
+            ("step", "3.", "按 Ctrl+Alt+Space 切换"),
+            ("center", "提示: 可在设置中自定义快捷键", 8, "#666666"),
+        )),
+    )
+
+    # 标签样式
+    TITLE_STYLE = "color: #0078D4; font-size: 14pt; font-weight: bold;"
+    BODY_STYLE = "color: #CCCCCC; font-size: 10pt;"
+    INDICATOR_ACTIVE_STYLE = "color: #0078D4; font-size: 12pt;"
+    INDICATOR_INACTIVE_STYLE = "color: #444444; font-size: 12pt;"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.config = get_config()
         self.current_page = 0
-        self.total_pages = 3
+        self.total_pages = len(self.PAGES)
+        self._page_states = self._build_page_states(self.total_pages)
+        self._shown_page = -1
 
         self._setup_ui()
         self.setStyleSheet(get_dark_theme())
 
-    def should_show(self) -> bool:
-        return self.config.get("app.first_run", True)
+    @staticmethod
+    def should_show() -> bool:
+        return get_config().get("app.first_run", True)
 
     def mark_completed(self):
         self.config.set("app.first_run", False)
@@ -49,10 +84,8 @@ class QtWelcomeDialog(QDialog):
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
 
+        # 页面按需构建：只翻到的页面才创建控件（多数用户在首页即跳过）
         self.stack = QStackedWidget()
-        self.stack.addWidget(self._build_page0())
-        self.stack.addWidget(self._build_page1())
-        self.stack.addWidget(self._build_page2())
         layout.addWidget(self.stack, 1)
 
         # 指示器
@@ -61,7 +94,7 @@ class QtWelcomeDialog(QDialog):
         self.indicators = []
         for _ in range(self.total_pages):
             label = QLabel("○")
-            label.setStyleSheet("color: #444444; font-size: 12pt;")
+            label.setStyleSheet(self.INDICATOR_INACTIVE_STYLE)
             indicator_row.addWidget(label)
             self.indicators.append(label)
         indicator_row.addStretch()
@@ -86,43 +119,28 @@ class QtWelcomeDialog(QDialog):
         button_row.addWidget(self.start_btn)
         layout.addLayout(button_row)
 
-    def _build_page0(self) -> QWidget:
-        page = QWidget()
-        layout = QVBoxLayout(page)
-        layout.setAlignment(Qt.AlignCenter)
-
-        layout.addWidget(self._center_label("欢迎使用", 12, "#888888"))
-        layout.addWidget(self._center_label("ContextSwitcher", 20, "#0078D4", bold=True))
-        layout.addWidget(self._center_label(""))
-        layout.addWidget(self._center_label("一款专为开发者设计的多任务上下文切换工具", 10, "#CCCCCC"))
-        layout.addWidget(self._center_label("快速切换不同任务的窗口环境", 9, "#888888"))
-        layout.addWidget(self._center_label("让您专注于当前工作，提升效率", 9, "#888888"))
-        return page
+    def _ensure_page(self, index: int):
+        # 只能逐页前进，按顺序补齐到目标页即可保持索引一致
+        while self.stack.count() <= index:
+            self.stack.addWidget(self._build_page(self.PAGES[self.stack.count()]))
 
-    def _build_page1(self) -> QWidget:
-        page = QWidget()
-        layout = QVBoxLayout(page)
-        layout.setAlignment(Qt.AlignLeft)
-
-        layout.addWidget(self._title_label("核心功能"))
-        layout.addWidget(self._feature_label("任务管理", "创建任务并绑定窗口"))
-        layout.addWidget(self._feature_label("快捷切换", "Ctrl+Alt+Space 快速切换"))
-        layout.addWidget(self._feature_label("窗口记忆", "自动记忆文件夹路径"))
-        layout.addWidget(self._feature_label("时间追踪", "记录任务专注时间"))
-        layout.addStretch()
-        return page
+    def _build_page(self, page_spec) -> QWidget:
+        alignment, add_stretch, items = page_spec
+        builders = {
+            "center": self._center_label,
+            "title": self._title_label,
+            "feature": self._feature_label,
+            "step": self._step_label,
+        }
 
-    def _build_page2(self) -> QWidget:
         page = QWidget()
         layout = QVBoxLayout(page)
-        layout.setAlignment(Qt.AlignLeft)
-
-        layout.addWidget(self._title_label("快速开始"))
-        layout.addWidget(self._step_label("1.", "点击 [+] 添加新任务"))
-        layout.addWidget(self._step_label("2.", "为任务选择要绑定的窗口"))
-        layout.addWidget(self._step_label("3.", "按 Ctrl+Alt+Space 切换"))
-        layout.addWidget(self._center_label("提示: 可在设置中自定义快捷键", 8, "#666666"))
-        layout.addStretch()
+        layout.setAlignment(alignment)
+
+        for kind, *args in items:
+            layout.addWidget(builders[kind](*args))
+        if add_stretch:
+            layout.addStretch()
         return page
 
     def _center_label(self, text: str, size: int = 10, color: str = "#FFFFFF", bold: bool = False) -> QLabel:
@@ -134,36 +152,59 @@ class QtWelcomeDialog(QDialog):
 
     def _title_label(self, text: str) -> QLabel:
         label = QLabel(text)
-        label.setStyleSheet("color: #0078D4; font-size: 14pt; font-weight: bold;")
+        label.setStyleSheet(self.TITLE_STYLE)
         return label
 
     def _feature_label(self, title: str, desc: str) -> QLabel:
         label = QLabel(f"{title} - {desc}")
-        label.setStyleSheet("color: #CCCCCC; font-size: 10pt;")
+        label.setStyleSheet(self.BODY_STYLE)
         return label
 
     def _step_label(self, step: str, text: str) -> QLabel:
         label = QLabel(f"{step} {text}")
-        label.setStyleSheet("color: #CCCCCC; font-size: 10pt;")
+        label.setStyleSheet(self.BODY_STYLE)
         return label
 
-    def _update_page(self):
-        self.stack.setCurrentIndex(self.current_page)
+    @classmethod
+    def _build_page_states(cls, total_pages: int) -> tuple:
+        # 每页对应：(各指示器的(文本, 样式), 上一步可见, 下一步可见, 开始使用可见)
+        active = ("●", cls.INDICATOR_ACTIVE_STYLE)
+        inactive = ("○", cls.INDICATOR_INACTIVE_STYLE)
+        return tuple(
+            (
+                tuple(active if idx == page else inactive for idx in range(total_pages)),
+                page > 0,
+                page < total_pages - 1,
+                page == total_pages - 1,
+            )
+            for page in range(total_pages)
+        )
 
-        for idx, indicator in enumerate(self.indicators):
-            if idx == self.current_page:
-                indicator.setText("●")
-                indicator.setStyleSheet("color: #0078D4; font-size: 12pt;")
-            else:
-                indicator.setText("○")
-                indicator.setStyleSheet("color: #444444; font-size: 12pt;")
+    def _update_page(self):
+        indicator_states, prev_visible, next_visible, start_visible = self._page_states[self.current_page]
 
-        is_first = self.current_page == 0
-        is_last = self.current_page == self.total_pages - 1
+        # 翻页涉及页面、指示器和按钮多处变更，暂停重绘后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            self._ensure_page(self.current_page)
+            self.stack.setCurrentIndex(self.current_page)
 
-        self.prev_btn.setVisible(not is_first)
-        self.next_btn.setVisible(not is_last)
-        self.start_btn.setVisible(is_last)
+            # 只更新状态发生变化的指示器（上一页与当前页），避免重复 polish 样式表
+            if self._shown_page < 0:
+                changed = range(self.total_pages)
+            else:
+                changed = {self._shown_page, self.current_page}
+            for idx in changed:
+                text, style = indicator_states[idx]
+                self.indicators[idx].setText(text)
+                self.indicators[idx].setStyleSheet(style)
+            self._shown_page = self.current_page
+
+            self.prev_btn.setVisible(prev_visible)
+            self.next_btn.setVisible(next_visible)
+            self.start_btn.setVisible(start_visible)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_skip(self):
         self.mark_completed()
@@ -185,11 +226,13 @@ class QtWelcomeDialog(QDialog):
 
 
 def show_welcome_if_first_run(parent=None) -> bool:
+    # 非首次运行是常见情况，先读配置，避免无谓地构建对话框和页面
+    if not QtWelcomeDialog.should_show():
+        return False
+
     dialog = QtWelcomeDialog(parent)
-    if dialog.should_show():
-        dialog.show_dialog()
-        return True
-    return False
+    dialog.show_dialog()
+    return True
 
 
 __all__ = ["QtWelcomeDialog", "show_welcome_if_first_run"]
@@ -16,6 +16,9 @@ def _get_styles_dir() -> Path:
 # 获取样式文件目录
 styles_dir = _get_styles_dir()
 
+# 已加载的样式表缓存（每个对话框创建时都会请求主题）
+_stylesheet_cache = {}
+
 
 def load_stylesheet(name: str = "dark") -> str:
     """
@@ -27,11 +30,17 @@ def load_stylesheet(name: str = "dark") -> str:
     Returns:
         QSS 样式表字符串
     """
+    cached = _stylesheet_cache.get(name)
+    if cached is not None:
+        return cached
+
+    content = ""
     style_file = styles_dir / f"{name}_theme.qss"
     if style_file.exists():
         with open(style_file, 'r', encoding='utf-8') as f:
-            return f.read()
-    return ""
+            content = f.read()
+    _stylesheet_cache[name] = content
+    return content
 
 
 def get_dark_theme() -> str:
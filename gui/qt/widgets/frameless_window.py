@@ -32,6 +32,7 @@ class CustomTitleBar(QWidget):
         # 保存拖拽状态
         self._old_pos: Optional[QPoint] = None
         self._drag_start_pos: Optional[QPoint] = None
+        self._drag_target: Optional[QWidget] = None
 
         self.setup_ui(title, icon)
 
@@ -80,22 +81,28 @@ class CustomTitleBar(QWidget):
         """鼠标按下 - 记录位置用于拖拽"""
         if event.button() == Qt.LeftButton:
             self._drag_start_pos = event.pos()
+            # 按下时解析一次拖拽目标，避免每次移动事件都遍历父级链
+            self._drag_target = self._find_drag_target()
 
     def mouseMoveEvent(self, event):
         """鼠标移动 - 触发窗口拖拽"""
-        if self._drag_start_pos and event.buttons() == Qt.LeftButton:
+        if self._drag_target and self._drag_start_pos and event.buttons() == Qt.LeftButton:
             # 通知父窗口移动
-            if self.parent():
-                parent = self.parent()
-                while parent and not isinstance(parent, (FramelessWindow, QMainWindow)):
-                    parent = parent.parent()
-                if parent and hasattr(parent, 'move_by_drag'):
-                    delta = event.pos() - self._drag_start_pos
-                    parent.move_by_drag(delta)
+            self._drag_target.move_by_drag(event.pos() - self._drag_start_pos)
 
     def mouseReleaseEvent(self, event):
         """鼠标释放"""
         self._drag_start_pos = None
+        self._drag_target = None
+
+    def _find_drag_target(self) -> Optional[QWidget]:
+        """查找可拖拽移动的顶层窗口"""
+        parent = self.parent()
+        while parent and not isinstance(parent, (FramelessWindow, QMainWindow)):
+            parent = parent.parent()
+        if parent and hasattr(parent, 'move_by_drag'):
+            return parent
+        return None
 
     def mouseDoubleClickEvent(self, event):
         """双击 - 最大化/还原"""
@@ -247,9 +254,9 @@ class FramelessWindow(QMainWindow):
     def mouseMoveEvent(self, event):
         """鼠标移动 - 拖拽窗口"""
         if self._is_dragging and self._drag_position:
-            delta = event.globalPosition().toPoint() - self._drag_position
-            self.move(self.pos() + delta)
-            self._drag_position = event.globalPosition().toPoint()
+            global_pos = event.globalPosition().toPoint()
+            self.move(self.pos() + global_pos - self._drag_position)
+            self._drag_position = global_pos
 
     def mouseReleaseEvent(self, event):
         """鼠标释放 - 停止拖拽"""
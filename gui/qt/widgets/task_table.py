@@ -27,6 +27,17 @@ except ImportError:
         PAUSED = "paused"
 
 
+# QColor 缓存：颜色种类固定，避免每个单元格重复构造
+_QCOLOR_CACHE = {}
+
+
+def _qcolor(name: str) -> QColor:
+    color = _QCOLOR_CACHE.get(name)
+    if color is None:
+        color = _QCOLOR_CACHE[name] = QColor(name)
+    return color
+
+
 class _NoFocusDelegate(QStyledItemDelegate):
     """移除单元格焦点绘制，避免出现竖线焦点框"""
 
@@ -51,8 +62,8 @@ class TaskTableWidget(QTableWidget):
     task_activated = Signal(int)  # 任务被激活（双击切换或回车）
 
     # 列定义
-    COLUMNS = ["P", "任务", "窗口", "状态", "距上次"]
-    COLUMN_WIDTHS = [20, 140, 24, 48, 48]
+    COLUMNS = ("P", "任务", "窗口", "状态", "距上次")
+    COLUMN_WIDTHS = (20, 140, 24, 48, 48)
 
     # 默认显示行数（小浮窗）
     DEFAULT_ROWS = 4
@@ -86,8 +97,10 @@ class TaskTableWidget(QTableWidget):
         super().__init__(parent)
 
         self._tasks: List = []
+        self._row_signatures: List[tuple] = []
         self._selected_row = -1
         self._loading = False
+        self._idle_warning_seconds = 10 * 60
 
         self._setup_table()
         self.setItemDelegate(_NoFocusDelegate(self))
@@ -97,17 +110,14 @@ class TaskTableWidget(QTableWidget):
         """设置表格"""
         # 设置列
         self.setColumnCount(len(self.COLUMNS))
-        self.setHorizontalHeaderLabels(self.COLUMNS)
+        self.setHorizontalHeaderLabels(list(self.COLUMNS))
 
         # 设置行数
         self.setRowCount(self.DEFAULT_ROWS)
 
-        # 设置列宽（小浮窗紧凑模式）
-        self.setColumnWidth(0, 20)   # 优先级 - 固定
-        self.setColumnWidth(1, 140)  # 任务名 - 最小宽度
-        self.setColumnWidth(2, 24)   # 窗口数 - 固定
-        self.setColumnWidth(3, 48)   # 状态 - 固定
-        self.setColumnWidth(4, 48)   # 距上次处理 - 固定
+        # 设置列宽（小浮窗紧凑模式；任务名列为最小宽度，其余固定）
+        for col, width in enumerate(self.COLUMN_WIDTHS):
+            self.setColumnWidth(col, width)
 
         # 设置表头拉伸模式
         header = self.horizontalHeader()
@@ -217,8 +227,17 @@ class TaskTableWidget(QTableWidget):
         Args:
             tasks: 任务对象列表
         """
-        self._loading = True
         self._tasks = tasks or []
+        # 阈值每次加载只读取一次配置，而不是每行读取
+        self._idle_warning_seconds = self._get_idle_warning_seconds()
+
+        # 显示内容未变化时跳过重建（定时刷新多数情况下数据不变）
+        signatures = [self._row_signature(task) for task in self._tasks]
+        if signatures == self._row_signatures and self.rowCount() == len(signatures):
+            return
+        self._row_signatures = signatures
+
+        self._loading = True
         self.setRowCount(len(self._tasks))
 
         for row, task in enumerate(self._tasks):
@@ -234,6 +253,19 @@ class TaskTableWidget(QTableWidget):
         self._loading = False
         self._apply_row_styles()
 
+    def _row_signature(self, task) -> tuple:
+        """生成行显示签名，用于判断是否需要重建该行"""
+        status = getattr(task, 'status', TaskStatus.TODO)
+        status_value = status.value if isinstance(status, TaskStatus) else status
+        return (
+            self._get_priority_icon(task),
+            getattr(task, 'name', 'Unknown'),
+            len(getattr(task, 'bound_windows', [])),
+            status_value,
+            self._get_last_active_text(task),
+            self._is_task_overdue(task),
+        )
+
     def _set_row_data(self, row: int, task):
         """设置行数据
 
@@ -260,14 +292,18 @@ class TaskTableWidget(QTableWidget):
         self.setItem(row, 3, self._create_centered_item(status_text, status_color))
 
         # 距上次处理
+        self.setItem(row, 4, self._create_item(self._get_last_active_text(task), alignment=Qt.AlignCenter))
+
+    def _get_last_active_text(self, task) -> str:
+        """获取距上次处理显示文本"""
         last_active_text = getattr(task, 'last_active_text', None)
-        if last_active_text is None:
-            last_active_seconds = getattr(task, 'last_active_seconds', None)
-            if last_active_seconds is None:
-                last_active_text = "未开始"
-            else:
-                last_active_text = self._format_elapsed(last_active_seconds)
-        self.setItem(row, 4, self._create_item(last_active_text, alignment=Qt.AlignCenter))
+        if last_active_text is not None:
+            return last_active_text
+
+        last_active_seconds = getattr(task, 'last_active_seconds', None)
+        if last_active_seconds is None:
+            return "未开始"
+        return self._format_elapsed(last_active_seconds)
 
     def _create_item(self, text: str, alignment: Optional[Qt.AlignmentFlag] = None) -> QTableWidgetItem:
         """创建表格项"""
@@ -281,7 +317,7 @@ class TaskTableWidget(QTableWidget):
         item = QTableWidgetItem(text)
         item.setTextAlignment(Qt.AlignCenter)
         # 设置前景色
-        item.setForeground(QColor(color))
+        item.setForeground(_qcolor(color))
         return item
 
     def _apply_row_styles(self) -> None:
@@ -295,6 +331,9 @@ class TaskTableWidget(QTableWidget):
 
     def _apply_row_text_colors(self, row: int, task, is_selected: bool) -> None:
         """根据选中状态与任务信息更新文字颜色"""
+        selected_color = _qcolor(self.SELECTED_TEXT_COLOR)
+        default_color = _qcolor(self.DEFAULT_TEXT_COLOR)
+
         for col in range(self.columnCount()):
             item = self.item(row, col)
             if not item:
@@ -305,16 +344,16 @@ class TaskTableWidget(QTableWidget):
                     item.setText(self.WAVE_WORKSPACE_ICON)
                 else:
                     item.setText(self.SELECTED_PRIORITY_ICON if is_selected else self._get_priority_icon(task))
-                item.setForeground(QColor(self.SELECTED_TEXT_COLOR if is_selected else self._get_priority_color(task)))
+                item.setForeground(selected_color if is_selected else _qcolor(self._get_priority_color(task)))
                 continue
 
             if is_selected:
-                item.setForeground(QColor(self.SELECTED_TEXT_COLOR))
+                item.setForeground(selected_color)
                 continue
             elif col == 3:
-                item.setForeground(QColor(self._get_status_color(task)))
+                item.setForeground(_qcolor(self._get_status_color(task)))
             else:
-                item.setForeground(QColor(self.DEFAULT_TEXT_COLOR))
+                item.setForeground(default_color)
 
     def _get_status_color(self, task) -> str:
         """获取状态列颜色"""
@@ -357,8 +396,7 @@ class TaskTableWidget(QTableWidget):
         if last_active_seconds <= 0:
             return False
 
-        threshold_seconds = self._get_idle_warning_seconds()
-        return last_active_seconds >= threshold_seconds
+        return last_active_seconds >= self._idle_warning_seconds
 
     def _get_idle_warning_seconds(self) -> int:
         """获取待机警告阈值（秒）"""
@@ -430,16 +468,15 @@ class TaskTableWidget(QTableWidget):
     def clear_tasks(self):
         """清空任务列表"""
         self._tasks = []
+        self._row_signatures = []
         self._selected_row = -1
         self.clearSelection()
         self.setRowCount(0)
 
     def get_selected_row(self) -> int:
         """获取选中的行索引"""
-        selected = self.selectedItems()
-        if selected:
-            return selected[0].row()
-        return -1
+        # 选中行已由 _on_selection_changed / load_tasks 维护，直接返回
+        return self._selected_row
 
     def select_row(self, row: int):
         """选中指定行"""
@@ -13,18 +13,28 @@ ContextSwitcher - 开发者多任务切换器
 版本: 1.0.0
 """
 
+import logging
 import sys
 import os
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from core.time_tracker import get_time_tracker
+
+logger = logging.getLogger(__name__)
+
 
 class ContextSwitcher:
     """ContextSwitcher主应用类"""
+
+    # 自动保存防抖间隔（毫秒），连续的任务变更只触发一次写盘
+    AUTO_SAVE_DELAY_MS = 500
     
     def __init__(self):
         """初始化应用"""
@@ -44,6 +54,17 @@ class ContextSwitcher:
         self.qt_hotkey_proxy = None
         self.task_dialog = None
         self.settings_dialog = None
+        self._delete_confirm_box = None  # 进行中的删除确认框（保持引用直到关闭）
+        self.time_tracker = get_time_tracker()  # 全局单例，load_data 和 cleanup 共用
+        self._save_timer = None
+
+        # 后台保存状态：同一时间只有一个保存线程，期间的新快照只保留最新一份
+        self._save_state_lock = threading.Lock()
+        self._pending_tasks_snapshot = None
+        self._save_thread = None
+
+        # 启动时在后台预读任务文件，load_data 时取结果
+        self._tasks_preload = None
 
         # 运行状态
         self.running = False
@@ -64,9 +85,6 @@ class ContextSwitcher:
             from core.task_status_manager import TaskStatusManager
             from utils.data_storage import DataStorage
             from gui.qt.qt_main_window import QtMainWindow
-            from gui.qt.qt_task_dialog import QtTaskDialog
-            from gui.qt.qt_settings_dialog import QtSettingsDialog
-            from gui.qt.qt_task_switcher import QtTaskSwitcher
             from gui.qt.widgets.system_tray import SystemTrayIcon
 
             print("正在初始化组件 (PySide6)...")
@@ -75,6 +93,11 @@ class ContextSwitcher:
             self.data_storage = DataStorage()
             print("  [OK] 数据存储模块")
 
+            # 任务文件的读取和 JSON 解析与下面的组件、窗口构建并行进行
+            preload_executor = ThreadPoolExecutor(max_workers=1)
+            self._tasks_preload = preload_executor.submit(self.data_storage.load_tasks)
+            preload_executor.shutdown(wait=False)
+
             # 初始化任务管理器
             self.task_manager = TaskManager()
             print("  [OK] 任务管理器")
@@ -100,19 +123,10 @@ class ContextSwitcher:
             self.main_window.task_status_manager = self.task_status_manager
             print("  [OK] 主窗口")
 
-            # 对话框
-            self.task_dialog = QtTaskDialog(self.main_window, self.task_manager)
-            self.settings_dialog = QtSettingsDialog(self.main_window, self.task_manager)
-            print("  [OK] 对话框")
-
-            # 初始化任务切换器
-            self.task_switcher = QtTaskSwitcher(self.task_manager)
-            print("  [OK] 任务切换器")
-
             # 初始化系统托盘
             try:
-                icon_path = project_root / "icon.ico"
-                self.tray_icon = SystemTrayIcon(icon_path if icon_path.exists() else None)
+                # 图标文件是否存在由 SystemTrayIcon 判断（不存在时绘制默认图标），此处不再重复检查
+                self.tray_icon = SystemTrayIcon(project_root / "icon.ico")
                 self.tray_icon.show_requested.connect(self._on_tray_show)
                 self.tray_icon.hide_requested.connect(self._on_tray_hide)
                 self.tray_icon.quit_requested.connect(self._on_tray_exit)
@@ -138,31 +152,28 @@ class ContextSwitcher:
     def load_data(self):
         """加载用户数据"""
         try:
-            # 从JSON文件加载任务数据
-            tasks_data = self.data_storage.load_tasks()
+            # 从JSON文件加载任务数据（优先使用初始化时的后台预读结果）
+            if self._tasks_preload is not None:
+                tasks_data = self._tasks_preload.result()
+                self._tasks_preload = None
+            else:
+                tasks_data = self.data_storage.load_tasks()
 
             if tasks_data:
                 # 重建任务对象
                 from core.task_manager import Task
-                for task_data in tasks_data:
-                    try:
-                        task = Task.from_dict(task_data)
-                        self.task_manager.tasks.append(task)
-                    except Exception as e:
-                        print(f"加载任务失败 {task_data.get('name', 'Unknown')}: {e}")
+                self.task_manager.tasks.extend(Task.from_dicts(tasks_data))
 
                 print(f"[OK] 已加载 {len(self.task_manager.tasks)} 个任务")
             else:
                 print("[OK] 无历史任务数据，从空白开始")
 
             # 加载时间追踪数据
-            from core.time_tracker import get_time_tracker
-            time_tracker = get_time_tracker()
+            time_tracker = self.time_tracker
             self.data_storage.load_time_tracking(time_tracker)
 
             # 更新任务名称映射
-            for task in self.task_manager.tasks:
-                time_tracker.task_names[task.id] = task.name
+            time_tracker.task_names.update({task.id: task.name for task in self.task_manager.tasks})
 
             return True
 
@@ -188,10 +199,16 @@ class ContextSwitcher:
         if not self.task_manager:
             return
 
+        from PySide6.QtCore import QTimer
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.AUTO_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._auto_save_tasks)
+
         def on_task_changed(task):
             if self.main_window:
                 self.main_window.update_display()
-            self._auto_save_tasks()
+            self._schedule_auto_save()
 
         def on_task_switched(task, index):
             if self.main_window:
@@ -203,29 +220,94 @@ class ContextSwitcher:
         self.task_manager.on_task_updated = on_task_changed
         self.task_manager.on_task_switched = on_task_switched
 
+    def _schedule_auto_save(self):
+        """延迟自动保存，合并短时间内的多次任务变更"""
+        # QTimer 只能在所属线程（GUI 主线程）启动；其他线程触发时直接保存
+        if self._save_timer and threading.current_thread() is threading.main_thread():
+            self._save_timer.start()
+        else:
+            self._auto_save_tasks()
+
     def _auto_save_tasks(self):
-        """自动保存任务数据"""
+        """自动保存任务数据（在 UI 线程生成快照，JSON 编码和写盘交给后台线程）"""
         try:
             if not self.data_storage or not self.task_manager:
                 return
-            tasks = self.task_manager.get_all_tasks()
-            self.data_storage.save_tasks(tasks)
+            # 推导式本身就生成新列表，直接遍历任务列表，无需 get_all_tasks() 再复制一份
+            snapshot = [task.to_dict() for task in self.task_manager.tasks]
         except Exception as e:
             print(f"自动保存失败: {e}")
+            return
+
+        with self._save_state_lock:
+            self._pending_tasks_snapshot = snapshot
+            if self._save_thread is not None:
+                # 正在保存，完成后会接着写入这份最新快照
+                return
+            self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+            self._save_thread.start()
+
+    def _save_worker(self):
+        """后台保存线程：循环写入最新快照，直到没有待保存的数据"""
+        while True:
+            with self._save_state_lock:
+                snapshot = self._pending_tasks_snapshot
+                self._pending_tasks_snapshot = None
+                if snapshot is None:
+                    self._save_thread = None
+                    return
+            try:
+                self.data_storage.save_tasks(snapshot)
+            except Exception as e:
+                print(f"自动保存失败: {e}")
+
+    def _wait_for_background_save(self, timeout: float = 5.0):
+        """丢弃未写入的快照并等待进行中的后台保存结束"""
+        with self._save_state_lock:
+            self._pending_tasks_snapshot = None
+            save_thread = self._save_thread
+        if save_thread is not None:
+            save_thread.join(timeout)
+
+    def _get_task_dialog(self):
+        """获取任务对话框（首次使用时才导入并创建，缩短启动时间）"""
+        if self.task_dialog is None and self.main_window and self.task_manager:
+            from gui.qt.qt_task_dialog import QtTaskDialog
+            self.task_dialog = QtTaskDialog(self.main_window, self.task_manager)
+        return self.task_dialog
+
+    def _get_settings_dialog(self):
+        """获取设置对话框（首次使用时才导入并创建）"""
+        if self.settings_dialog is None and self.main_window and self.task_manager:
+            from gui.qt.qt_settings_dialog import QtSettingsDialog
+            self.settings_dialog = QtSettingsDialog(self.main_window, self.task_manager)
+        return self.settings_dialog
+
+    def _get_task_switcher(self):
+        """获取任务切换器（主窗口显示后的首个空闲时刻预先创建，热键触发时兜底创建）"""
+        if self.task_switcher is None and self.task_manager:
+            from gui.qt.qt_task_switcher import QtTaskSwitcher
+            self.task_switcher = QtTaskSwitcher(self.task_manager)
+            print("[OK] 任务切换器")
+        return self.task_switcher
 
     def _on_qt_add_task(self):
         """PySide6 添加任务"""
-        if not self.task_dialog:
+        task_dialog = self._get_task_dialog()
+        if not task_dialog:
             return
-        result = self.task_dialog.show_add_dialog()
+        result = task_dialog.show_add_dialog()
         if result and self.main_window:
             self.main_window.update_display()
 
     def _on_qt_edit_task(self, task):
         """PySide6 编辑任务"""
-        if not self.task_dialog or not task:
+        if not task:
             return
-        result = self.task_dialog.show_edit_dialog(task)
+        task_dialog = self._get_task_dialog()
+        if not task_dialog:
+            return
+        result = task_dialog.show_edit_dialog(task)
         if result and self.main_window:
             self.main_window.update_display()
 
@@ -234,28 +316,44 @@ class ContextSwitcher:
         if not self.task_manager or not task:
             return
 
-        try:
-            from PySide6.QtWidgets import QMessageBox
-            confirm = QMessageBox.question(
-                self.main_window,
-                "删除任务",
-                f"确定要删除任务 \"{task.name}\" 吗？",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            if confirm != QMessageBox.Yes:
-                return
-        except Exception:
-            pass
+        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QMessageBox
+
+        # 使用 open() 以窗口模态显示确认框，不再进入 question() 的嵌套事件循环
+        confirm_box = QMessageBox(
+            QMessageBox.Question,
+            "删除任务",
+            f"确定要删除任务 \"{task.name}\" 吗？",
+            QMessageBox.Yes | QMessageBox.No,
+            self.main_window
+        )
+        confirm_box.setAttribute(Qt.WA_DeleteOnClose)
+        task_id = task.id
+        confirm_box.finished.connect(
+            lambda _result: self._on_delete_confirmed(confirm_box, task_id)
+        )
+        self._delete_confirm_box = confirm_box
+        confirm_box.open()
+
+    def _on_delete_confirmed(self, confirm_box, task_id: str):
+        """删除确认框关闭后执行删除"""
+        from PySide6.QtWidgets import QMessageBox
+
+        self._delete_confirm_box = None
+        clicked = confirm_box.clickedButton()
+        if clicked is None or confirm_box.standardButton(clicked) != QMessageBox.Yes:
+            return
 
-        self.task_manager.remove_task(task.id)
+        self.task_manager.remove_task(task_id)
         if self.main_window:
             self.main_window.update_display()
 
     def _on_qt_settings(self):
         """PySide6 设置对话框"""
-        if not self.settings_dialog:
+        settings_dialog = self._get_settings_dialog()
+        if not settings_dialog:
             return
-        result = self.settings_dialog.show_settings_dialog()
+        result = settings_dialog.show_settings_dialog()
         if result and self.main_window:
             self.main_window.update_display()
     
@@ -268,9 +366,8 @@ class ContextSwitcher:
                 print("[OK] 热键管理器已连接到 Qt 代理")
             else:
                 print("⚠️ Qt 热键代理未初始化，使用备用回调方案")
-                self.hotkey_manager.on_switcher_triggered = self.show_task_switcher
 
-            # 备用回调（用于异常兜底）
+            # 备用回调：无 Qt 代理或向代理发送事件失败时才会被调用
             self.hotkey_manager.on_switcher_triggered = self.show_task_switcher
             
             # 启动热键监听器
@@ -287,11 +384,16 @@ class ContextSwitcher:
             print(f"[ERROR] 热键注册失败: {e}")
             return False
     
+    def _on_hotkey_triggered(self, _hotkey_name: str):
+        """Qt 热键代理信号：在主线程显示任务切换器"""
+        self.show_task_switcher()
+
     def show_task_switcher(self):
         """显示任务切换器"""
         try:
-            if self.task_switcher:
-                print("🎯 热键触发任务切换器...")
+            task_switcher = self._get_task_switcher()
+            if task_switcher:
+                logger.debug("热键触发任务切换器")
                 # 获取主窗口位置
                 main_window_position = None
                 if self.main_window:
@@ -301,17 +403,14 @@ class ContextSwitcher:
                     except Exception:
                         pass
 
-                result = self.task_switcher.show_switcher(main_window_position)
-                if result:
-                    print("✅ 任务切换器执行成功")
-                else:
-                    print("🔄 任务切换器已显示或用户取消")
+                result = task_switcher.show_switcher(main_window_position)
+                logger.debug("任务切换器结果: %s", "执行成功" if result else "已显示或用户取消")
             else:
                 print("⚠️ 任务切换器未初始化")
         except Exception as e:
             print(f"显示任务切换器失败: {e}")
-            import traceback
-            traceback.print_exc()
+            # 热键可能被反复触发，完整堆栈只在调试日志中输出
+            logger.debug("显示任务切换器异常", exc_info=True)
 
     def _show_welcome_if_needed(self):
         """如果是首次运行，显示欢迎引导"""
@@ -350,7 +449,7 @@ class ContextSwitcher:
         try:
             try:
                 from PySide6.QtWidgets import QApplication
-                from PySide6.QtCore import QObject, Signal
+                from PySide6.QtCore import QObject, QTimer, Signal
             except ImportError:
                 print("错误: 请先安装 PySide6")
                 print("运行: pip install PySide6")
@@ -372,7 +471,7 @@ class ContextSwitcher:
                         self.hotkey_error.emit(value)
 
             self.qt_hotkey_proxy = _QtHotkeyProxy()
-            self.qt_hotkey_proxy.hotkey_triggered.connect(lambda _name: self.show_task_switcher())
+            self.qt_hotkey_proxy.hotkey_triggered.connect(self._on_hotkey_triggered)
             self.qt_hotkey_proxy.hotkey_error.connect(lambda msg: print(f"热键错误: {msg}"))
 
             # 初始化组件
@@ -392,6 +491,9 @@ class ContextSwitcher:
             print("启动主界面 (PySide6)...")
             self.main_window.show()
 
+            # 任务切换器不参与首帧绘制，进入事件循环后的首个空闲时刻再创建
+            QTimer.singleShot(0, self._get_task_switcher)
+
             # 启动系统托盘
             if self.tray_icon:
                 self.tray_icon.show()
@@ -421,8 +523,7 @@ class ContextSwitcher:
             self.running = False
 
             # 结束当前任务的时间追踪会话
-            from core.time_tracker import get_time_tracker
-            time_tracker = get_time_tracker()
+            time_tracker = self.time_tracker
             if time_tracker.current_session:
                 ended_session = time_tracker.end_session()
                 if ended_session and self.task_manager:
@@ -451,6 +552,11 @@ class ContextSwitcher:
                 except Exception:
                     pass
 
+            # 待执行的延迟保存和后台保存由下面的最终保存覆盖
+            if self._save_timer:
+                self._save_timer.stop()
+            self._wait_for_background_save()
+
             # 保存数据（最终保存，作为双重保险）
             if self.data_storage and self.task_manager:
                 print("[INFO] 执行退出时的最终保存（双重保险）...")
@@ -133,13 +133,22 @@ class Config:
             return self.default_config.copy()
     
     def _merge_config(self, default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
-        """合并配置，确保所有默认键都存在"""
-        for key, value in default.items():
-            if key in loaded:
-                if isinstance(value, dict) and isinstance(loaded[key], dict):
-                    default[key] = self._merge_config(value, loaded[key])
+        """合并配置，确保所有默认键都存在
+
+        以显式栈代替递归逐层合并；只处理加载配置中出现、且默认配置也有的键，
+        未出现的默认值保持不变，未知的旧键照旧忽略。
+        """
+        stack = [(default, loaded)]
+        while stack:
+            default_section, loaded_section = stack.pop()
+            for key, loaded_value in loaded_section.items():
+                if key not in default_section:
+                    continue
+                default_value = default_section[key]
+                if isinstance(default_value, dict) and isinstance(loaded_value, dict):
+                    stack.append((default_value, loaded_value))
                 else:
-                    default[key] = loaded[key]
+                    default_section[key] = loaded_value
         return default
     
     def _save_config(self, config: Dict[str, Any] = None) -> bool:
@@ -247,10 +256,13 @@ class Config:
         return success
 
 
-# 全局配置实例
-config = Config()
+# 全局配置实例（首次调用 get_config() 时才创建，导入本模块不触发磁盘读写）
+_config: Optional[Config] = None
 
 
 def get_config() -> Config:
     """获取全局配置实例"""
-    return config
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
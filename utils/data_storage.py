@@ -11,6 +11,7 @@
 import json
 import os
 import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -29,6 +30,12 @@ class DataStorage:
         self.time_tracking_file = self.data_dir / "time_tracking.json"  # 时间追踪数据文件
         self.backup_dir = self.data_dir / "backups"
 
+        # 保存锁：任务可能在后台线程保存，避免并发写同一个临时文件
+        self._save_lock = threading.Lock()
+
+        # 最近一次成功写盘的内容，内容未变化时跳过重复保存（如退出时的最终保存）
+        self._last_saved_tasks_data: Optional[List[Dict[str, Any]]] = None
+
         # 确保目录存在
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -38,24 +45,36 @@ class DataStorage:
         self.auto_backup = self.config.get('data.auto_save', True)
     
     def save_tasks(self, tasks: List[Any]) -> bool:
-        """保存任务列表到文件
+        """保存任务列表到文件（线程安全，可在后台线程调用）
         
         Args:
-            tasks: 任务对象列表
+            tasks: 任务对象列表，或已经 to_dict() 的任务字典列表
             
         Returns:
             是否成功保存
         """
+        with self._save_lock:
+            return self._save_tasks(tasks)
+
+    def _save_tasks(self, tasks: List[Any]) -> bool:
+        """保存任务列表到文件（调用方需持有保存锁）"""
         try:
             # 转换为可序列化的格式
             tasks_data = []
             for task in tasks:
-                if hasattr(task, 'to_dict'):
+                if isinstance(task, dict):
+                    # 调用方已在 UI 线程生成的快照
+                    tasks_data.append(task)
+                elif hasattr(task, 'to_dict'):
                     tasks_data.append(task.to_dict())
                 else:
                     # 如果对象没有to_dict方法，尝试直接序列化
                     tasks_data.append(self._serialize_object(task))
             
+            # 与上次写入的内容相同则无需再次写盘和备份
+            if tasks_data == self._last_saved_tasks_data and self.tasks_file.exists():
+                return True
+            
             # 创建完整的数据结构
             data = {
                 "version": "1.3.0",  # v1.3.0: 支持任务级 todo_items
@@ -75,6 +94,7 @@ class DataStorage:
             
             # 原子替换
             shutil.move(str(temp_file), str(self.tasks_file))
+            self._last_saved_tasks_data = tasks_data
             
             print(f"[OK] 已保存 {len(tasks_data)} 个任务到 {self.tasks_file}")
             return True
@@ -5,9 +5,13 @@
 提供简单易用的API，支持不同类型弹窗的位置策略。
 """
 
+import logging
 from typing import Tuple, Optional, Any
 from utils.screen_helper import ScreenHelper
 
+# 每次弹窗定位都会产生的跟踪信息走 debug 日志，默认级别下不做格式化
+logger = logging.getLogger(__name__)
+
 
 class DialogPositionManager:
     """对话框位置管理器"""
@@ -42,7 +46,7 @@ class DialogPositionManager:
         try:
             strategy = strategy or self.default_strategy
             
-            print(f"🎯 计算对话框位置: 策略={strategy}, 尺寸={dialog_size}")
+            logger.debug("计算对话框位置: 策略=%s, 尺寸=%s", strategy, dialog_size)
             
             if strategy == "main_window_center" and main_window_position and main_window_size:
                 # 相对于主窗口中心显示
@@ -97,7 +101,8 @@ class DialogPositionManager:
                 dialog_x = max(work_left, min(dialog_x, work_right - dialog_width))
                 dialog_y = max(work_top, min(dialog_y, work_bottom - dialog_height))
             
-            print(f"偏移定位: 主窗口({main_x}, {main_y}) + 偏移({offset_x}, {offset_y}) -> 对话框({dialog_x}, {dialog_y})")
+            logger.debug("偏移定位: 主窗口(%s, %s) + 偏移(%s, %s) -> 对话框(%s, %s)",
+                         main_x, main_y, offset_x, offset_y, dialog_x, dialog_y)
             
             return (dialog_x, dialog_y)
             
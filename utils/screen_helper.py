@@ -8,6 +8,7 @@
 - 屏幕边界检查
 """
 
+import logging
 from typing import Tuple, Optional
 
 try:
@@ -20,6 +21,10 @@ except ImportError:
     raise
 
 
+# 定位计算的跟踪信息走 debug 日志，默认级别下不做格式化
+logger = logging.getLogger(__name__)
+
+
 class ScreenHelper:
     """屏幕位置辅助工具类"""
     
@@ -131,7 +136,7 @@ class ScreenHelper:
                 window_x, window_y, window_width, window_height, screen_info
             )
             
-            print(f"计算窗口位置: 屏幕中央({center_x}, {center_y}) -> 窗口({window_x}, {window_y})")
+            logger.debug("计算窗口位置: 屏幕中央(%s, %s) -> 窗口(%s, %s)", center_x, center_y, window_x, window_y)
             
             return (window_x, window_y)
             
@@ -258,7 +263,8 @@ class ScreenHelper:
                 window_x = max(work_left, min(window_x, work_right - window_size[0]))
                 window_y = max(work_top, min(window_y, work_bottom - window_size[1]))
                 
-                print(f"多屏幕定位: 显示器({work_left}, {work_top}, {work_right}, {work_bottom}) -> 窗口({window_x}, {window_y})")
+                logger.debug("多屏幕定位: 显示器(%s, %s, %s, %s) -> 窗口(%s, %s)",
+                             work_left, work_top, work_right, work_bottom, window_x, window_y)
                 
                 return (window_x, window_y)
             
@@ -347,7 +353,8 @@ class ScreenHelper:
                     dialog_x = max(work_left, min(dialog_x, work_right - dialog_width))
                     dialog_y = max(work_top, min(dialog_y, work_bottom - dialog_height))
                     
-                    print(f"对话框定位: 主窗口屏幕({work_left}, {work_top}, {work_right}, {work_bottom}) -> 对话框({dialog_x}, {dialog_y})")
+                    logger.debug("对话框定位: 主窗口屏幕(%s, %s, %s, %s) -> 对话框(%s, %s)",
+                                 work_left, work_top, work_right, work_bottom, dialog_x, dialog_y)
                     
                     return (dialog_x, dialog_y)
             
@@ -396,7 +403,8 @@ class ScreenHelper:
                 dialog_x = max(work_left, min(dialog_x, work_right - dialog_width))
                 dialog_y = max(work_top, min(dialog_y, work_bottom - dialog_height))
             
-            print(f"相对主窗口定位: 主窗口中心({main_center_x}, {main_center_y}) -> 对话框({dialog_x}, {dialog_y})")
+            logger.debug("相对主窗口定位: 主窗口中心(%s, %s) -> 对话框(%s, %s)",
+                         main_center_x, main_center_y, dialog_x, dialog_y)
             
             return (dialog_x, dialog_y)
             
@@ -9,6 +9,7 @@
 """
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -66,17 +67,26 @@ class SearchHelper:
         if not text or not keywords:
             return text
         
+        patterns = SearchHelper._compile_highlight_patterns(keywords, highlight_start, highlight_end)
+        return SearchHelper._apply_highlight_patterns(text, patterns)
+    
+    @staticmethod
+    def _compile_highlight_patterns(keywords: List[str],
+                                    highlight_start: str = "**",
+                                    highlight_end: str = "**") -> List[Tuple[Any, str]]:
+        """预编译关键词的高亮正则（大小写不敏感），同一次搜索内复用"""
+        return [
+            (re.compile(re.escape(keyword), re.IGNORECASE),
+             f"{highlight_start}{keyword}{highlight_end}")
+            for keyword in keywords if keyword
+        ]
+    
+    @staticmethod
+    def _apply_highlight_patterns(text: str, patterns: List[Tuple[Any, str]]) -> str:
+        """依次应用预编译的高亮正则"""
         result = text
-        
-        for keyword in keywords:
-            if keyword:
-                # 使用正则表达式进行大小写不敏感的替换
-                pattern = re.escape(keyword)
-                replacement = f"{highlight_start}{keyword}{highlight_end}"
-                
-                # 使用re.IGNORECASE标志进行大小写不敏感匹配
-                result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        
+        for pattern, replacement in patterns:
+            result = pattern.sub(replacement, result)
         return result
     
     @staticmethod
@@ -99,7 +109,7 @@ class SearchHelper:
         if not text or not keywords:
             return 0, []
 
-        text_lower = text.lower()
+        text_lower, text_chars = SearchHelper._prepare_text(text)
         matched_keywords = []
         score = 0
 
@@ -121,6 +131,10 @@ class SearchHelper:
                 keyword_score += len(keyword)
                 matched_keywords.append(keyword)
 
+            # 快速排除：关键词中出现在文本里的字符太少时，以下几种匹配都不可能成功
+            elif not SearchHelper._has_enough_chars(text_chars, keyword_lower):
+                pass
+
             # 2. 首字母缩写匹配（如 "vsc" -> "Visual Studio Code"）
             elif SearchHelper._match_initials(text, keyword_lower):
                 keyword_score = 35 + len(keyword)
@@ -142,6 +156,37 @@ class SearchHelper:
 
         return score, matched_keywords
 
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _prepare_text(text: str) -> Tuple[str, frozenset]:
+        """预计算文本的小写形式及其字符集合
+
+        窗口标题和进程名在连续按键间基本不变，按文本缓存可避免每次筛选都重新 lower()。
+
+        Returns:
+            元组 (小写文本, 小写文本的字符集合)
+        """
+        text_lower = text.lower()
+        return text_lower, frozenset(text_lower)
+
+    @staticmethod
+    def _has_enough_chars(text_chars: frozenset, keyword: str) -> bool:
+        """检查关键词中出现在文本里的字符是否达到 60%
+
+        缩写和子序列匹配只会用到文本中存在的字符，子序列匹配至少需要 60%；
+        模糊匹配最多允许 len // 3 处编辑，因此同样至少有 60% 的字符存在于文本中。
+        达不到该比例时可直接判定不匹配，省去正则切分、子序列扫描和编辑距离计算。
+
+        Args:
+            text_chars: 文本（小写）的字符集合
+            keyword: 搜索关键词（小写）
+
+        Returns:
+            是否可能匹配
+        """
+        present = sum(1 for char in keyword if char in text_chars)
+        return present >= len(keyword) * 0.6
+
     @staticmethod
     def _match_initials(text: str, keyword: str) -> bool:
         """匹配首字母缩写
@@ -221,17 +266,21 @@ class SearchHelper:
         # 对文本中的每个单词进行模糊匹配
         words = re.split(r'[\s\-_\.]+', text)
 
+        # 允许的编辑距离与关键词长度成正比
+        keyword_len = len(keyword)
+        allowed_distance = min(max_distance, keyword_len // 3)
+
         best_score = 0
         for word in words:
             if not word:
                 continue
-            word_lower = word.lower()
 
-            # 计算编辑距离
-            distance = SearchHelper._levenshtein_distance(word_lower, keyword)
+            # 长度差本身就是编辑距离的下界，超出允许范围时跳过昂贵的编辑距离计算
+            if abs(len(word) - keyword_len) > allowed_distance:
+                continue
 
-            # 允许的编辑距离与关键词长度成正比
-            allowed_distance = min(max_distance, len(keyword) // 3)
+            # 计算编辑距离
+            distance = SearchHelper._levenshtein_distance(word.lower(), keyword)
 
             if distance <= allowed_distance:
                 # 编辑距离越小，分数越高
@@ -298,6 +347,17 @@ class SearchHelper:
         
         results = []
         
+        # 高亮正则只编译一次；同名进程的窗口很多，高亮结果按原文本缓存
+        highlight_patterns = SearchHelper._compile_highlight_patterns(keywords)
+        highlight_cache: Dict[str, str] = {}
+        
+        def highlight(text: str) -> str:
+            highlighted = highlight_cache.get(text)
+            if highlighted is None:
+                highlighted = SearchHelper._apply_highlight_patterns(text, highlight_patterns) if text else text
+                highlight_cache[text] = highlighted
+            return highlighted
+        
         for window in windows:
             # 计算标题匹配
             title_score, title_matches = SearchHelper.calculate_match_score(window.title, keywords)
@@ -318,8 +378,8 @@ class SearchHelper:
                     match_fields.append("process")
                 
                 # 生成高亮文本
-                highlighted_title = SearchHelper.highlight_text(window.title, keywords)
-                highlighted_process = SearchHelper.highlight_text(window.process_name, keywords)
+                highlighted_title = highlight(window.title)
+                highlighted_process = highlight(window.process_name)
                 
                 results.append(SearchResult(
                     item=window,
@@ -54,8 +54,6 @@ class WindowPriorityManager:
         Returns:
             按优先级排序的窗口优先级列表
         """
-        priorities = []
-        
         # 获取前台窗口信息
         foreground_hwnd = None
         active_hwnds = set()
@@ -72,11 +70,11 @@ class WindowPriorityManager:
                 recent_hwnds.add(window.hwnd)
         
         # 为每个窗口计算优先级
-        for window in windows:
-            priority = self._calculate_single_window_priority(
-                window, foreground_hwnd, active_hwnds, recent_hwnds, search_results
-            )
-            priorities.append(priority)
+        calculate = self._calculate_single_window_priority
+        priorities = [
+            calculate(window, foreground_hwnd, active_hwnds, recent_hwnds, search_results)
+            for window in windows
+        ]
         
         # 按总分排序（降序）
         priorities.sort(key=lambda x: x.total_score, reverse=True)